@@ -16,6 +16,7 @@
         along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import argparse
+import math
 from typing import Any
 from ggtransfer import Sender, Receiver, GgArgumentsError, __version__
 
@@ -43,7 +44,17 @@ def is_postive_int(val: str) -> int:
     raise argparse.ArgumentTypeError("number of pieces must be a positive integer.")
 
 
-def _main() -> None:
+def is_non_negative_float(val: str) -> float:
+    try:
+        val_float = float(val)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("number of seconds must be a non-negative number.") from e
+    if math.isfinite(val_float) and val_float >= 0:
+        return val_float
+    raise argparse.ArgumentTypeError("number of seconds must be a finite non-negative number.")
+
+
+def _get_parser() -> argparse.ArgumentParser:
     # noinspection PyTypeChecker
     parser = argparse.ArgumentParser(prog="gg-transfer",
                                      # formatter_class=GgHelpFormatter,
@@ -79,6 +90,19 @@ def _main() -> None:
         type=int,
         choices=range(0, 9)
     )
+    sender.add_argument(
+        "-t", "--max-tx",
+        help="maximum continuous TX time in seconds. Pieces are grouped in bursts\n"
+             "that fit this window, default no limit.",
+        default=0, type=is_non_negative_float, metavar="<seconds>")
+    sender.add_argument(
+        "-c", "--cooldown",
+        help="seconds of silence between bursts (defaults to %(default)s).",
+        default=0, type=is_non_negative_float, metavar="<seconds>")
+    sender.add_argument(
+        "-d", "--dry-run",
+        help="do not play audio, print the planned bursts and airtime.",
+        action="store_true", default=False)
     sender.set_defaults(command="send")
 
     # noinspection PyTypeChecker
@@ -108,7 +132,11 @@ def _main() -> None:
             help="decode data from Base64 and use file transfer mode.",
             action="store_true", default=False)
 
-    args: argparse.Namespace = parser.parse_args()
+    return parser
+
+
+def _main() -> None:
+    args: argparse.Namespace = _get_parser().parse_args()
 
     if args.command == "send":
         Sender(args).send()
@@ -18,34 +18,53 @@
 import argparse
 import base64
 import binascii
+import math
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import sounddevice as sd # type: ignore
 import ggwave # type: ignore
 from ._exceptions import GgIOError, GgUnicodeError, GgArgumentsError
 
 
 class Sender:
+    _SILENCE_BLOCK: bytes = b'\x00' * 4 * 4096
 
     def __init__(self, args: Optional[argparse.Namespace] = None, inputfile: Optional[str] = None,
-                 protocol: int = 0, file_transfer: bool = False):
+                 protocol: int = 0, file_transfer: bool = False, max_tx: float = 0,
+                 cooldown: float = 0, dry_run: bool = False):
 
         if args is not None and isinstance(args, argparse.Namespace):
             self.protocol = args.protocol
             self.file_transfer_mode = args.file_transfer
             self.crc = self.file_transfer_mode
             self.input = args.input
+            self.max_tx = args.max_tx
+            self.cooldown = args.cooldown
+            self.dry_run = args.dry_run
         elif args is None:
             self.protocol = protocol
             self.file_transfer_mode = file_transfer
             self.crc = self.file_transfer_mode
             self.input = inputfile
+            self.max_tx = max_tx
+            self.cooldown = cooldown
+            self.dry_run = dry_run
         else:
             raise GgArgumentsError("Wrong set of arguments.")
 
+        if not (math.isfinite(self.max_tx) and math.isfinite(self.cooldown)) \
+                or self.max_tx < 0 or self.cooldown < 0:
+            raise GgArgumentsError("Maximum TX time and cooldown must be finite and not negative.")
+
         self._sample_rate = 48000
+        # Burst plan of the last send(): number of bursts, seconds on air, seconds of cooldown
+        # and total seconds including padding.
+        self.bursts = 0
+        self.airtime = 0.0
+        self.cooldown_time = 0.0
+        self.total_time = 0.0
 
     def send(self, msg: Optional[str] = None) -> bool:
         stream: Optional[sd.RawOutputStream] = None
@@ -61,8 +80,11 @@ class Sender:
             # 7 = [DT] Fast
             # 8 = [DT] Fastest
 
-            stream = sd.RawOutputStream(dtype="float32", channels=1, samplerate=float(self._sample_rate), blocksize=4096)
-            stream.start()
+            self.bursts = 0
+            self.airtime = 0.0
+            self.cooldown_time = 0.0
+            self.total_time = 0.0
+            header: Optional[str] = None
             if self.input is not None and self.input != "-" and msg is None:
                 file_path = Path(self.input)
                 if not file_path.is_file():
@@ -78,11 +100,6 @@ class Sender:
                         fixed_length_hex: str = f'{crc32_c:08x}'
                         ar, ln = self._get_array(base, crc=self.crc)
                         header = f'{{"pieces": {ln}, "size": {size}, "crc": "{fixed_length_hex}"}}'
-                        print("Sending header, length:", len(header), flush=True, file=sys.stderr)
-                        print("Pieces:", ln, flush=True, file=sys.stderr)
-                        stream.write(b'0' * 4 * self._sample_rate * 1)
-                        waveform = ggwave.encode(header, protocolId=self.protocol, volume=60)
-                        stream.write(waveform)
                     else:
                         try:
                             base = f.read().decode("utf-8")
@@ -100,6 +117,26 @@ class Sender:
                 except UnicodeDecodeError as e:
                     raise GgUnicodeError("Cannot send binary data read from pipes or STDIN.") from e
 
+            has_header = header is not None
+            frames = ([header] if header is not None else []) + ar
+            lead_in = 1 if has_header else 0
+            plan = self._plan_bursts(frames)
+            self.total_time = lead_in + self.airtime + self.cooldown_time + 1
+            if self.dry_run:
+                if msg is None:
+                    print("Planned bursts:", self.bursts, flush=True, file=sys.stderr)
+                    print(f"Planned airtime: {self.airtime:.2f} s", flush=True, file=sys.stderr)
+                    print(f"Planned total time (with cooldowns and padding): {self.total_time:.2f} s",
+                          flush=True, file=sys.stderr)
+                return True
+
+            stream = sd.RawOutputStream(dtype="float32", channels=1, samplerate=float(self._sample_rate),
+                                        blocksize=4096)
+            stream.start()
+            if header is not None:
+                print("Sending header, length:", len(header), flush=True, file=sys.stderr)
+                print("Pieces:", ln, flush=True, file=sys.stderr)
+                self._write_silence(stream, lead_in)
             crc_size = 8 if self.file_transfer_mode else 0
             if msg is None:
                 print("Sending data, length:", len(base) + (crc_size * ln), flush=True,
@@ -109,18 +146,26 @@ class Sender:
             if msg is None:
                 print(f"Piece {q-1}/{ln} {totsize} B", end="\r", flush=True, file=sys.stderr)
             t = time.time()
-            for piece in ar:
-                waveform = ggwave.encode(piece, protocolId=self.protocol, volume=60)
-                stream.write(waveform)
-                totsize += len(piece)
-                if msg is None:
-                    print(f"Piece {q}/{ln} {totsize} B", end="\r", flush=True, file=sys.stderr)
-                q += 1
+            for i, burst in enumerate(plan):
+                if i > 0:
+                    self._write_silence(stream, self.cooldown)
+                for n in burst:
+                    piece = frames[n]
+                    waveform = ggwave.encode(piece, protocolId=self.protocol, volume=60)
+                    stream.write(waveform)
+                    if has_header and n == 0:
+                        # The header is not a data piece.
+                        continue
+                    totsize += len(piece)
+                    if msg is None:
+                        print(f"Piece {q}/{ln} {totsize} B", end="\r", flush=True, file=sys.stderr)
+                    q += 1
             tt = time.time() - t
-            stream.write(b'0' * 4 * self._sample_rate * 1)
+            self._write_silence(stream, 1)
             if msg is None:
                 print(flush=True, file=sys.stderr)
-                print("Time taken to encode waveform:", tt, flush=True, file=sys.stderr)
+                print(f"Bursts: {self.bursts}, airtime: {self.airtime:.2f} s", flush=True, file=sys.stderr)
+                print("Time taken to send (with cooldowns):", tt, flush=True, file=sys.stderr)
             if self.file_transfer_mode and msg is None:
                 print("Speed (size of encoded payload + CRC):", len(base) / tt, "B/s", flush=True, file=sys.stderr)
             if size and msg is None:
@@ -148,6 +193,39 @@ class Sender:
                 stream.close()
         return True
 
+    def _plan_bursts(self, frames: List[str]) -> List[List[int]]:
+        # Every frame is checked before any audio is played, so a transfer is never cut halfway.
+        # Bursts hold frame indices: waveforms are encoded again while playing, one at a time.
+        bursts: List[List[int]] = []
+        burst_airtime = 0.0
+        airtimes: Dict[int, float] = {}
+        for n, frame in enumerate(frames):
+            # Waveforms are float32 mono and their length only depends on the payload length.
+            frame_len = len(frame.encode("utf-8"))
+            if frame_len not in airtimes:
+                waveform = ggwave.encode(frame, protocolId=self.protocol, volume=60)
+                airtimes[frame_len] = len(waveform) / (4 * self._sample_rate)
+            airtime = airtimes[frame_len]
+            if self.max_tx > 0 and airtime > self.max_tx:
+                raise GgArgumentsError(f"A single frame lasts {airtime:.2f} s, longer than the "
+                                       f"maximum TX time of {self.max_tx} s.")
+            if not bursts or (self.max_tx > 0 and burst_airtime + airtime > self.max_tx):
+                bursts.append([])
+                burst_airtime = 0.0
+            bursts[-1].append(n)
+            burst_airtime += airtime
+            self.airtime += airtime
+        self.bursts = len(bursts)
+        self.cooldown_time = self.cooldown * max(self.bursts - 1, 0)
+        return bursts
+
+    def _write_silence(self, stream: sd.RawOutputStream, seconds: float) -> None:
+        remaining = 4 * int(self._sample_rate * seconds)
+        while remaining > 0:
+            block = self._SILENCE_BLOCK[:remaining]
+            stream.write(block)
+            remaining -= len(block)
+
     @staticmethod
     def _get_array(data: str, crc: bool = False) -> Tuple[List[str], int]:
         siz = 132 if crc else 140
@@ -15,8 +15,33 @@
         You should have received a copy of the GNU General Public License
         along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import contextlib
+import io
+import tempfile
 import unittest
+from pathlib import Path
+from typing import List
+from unittest import mock
 import ggtransfer
+from ggtransfer.__main__ import _get_parser
+
+
+class RecordingStream:
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.writes: List[bytes] = []
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(bytes(data))
 
 
 class SendTestCase(unittest.TestCase):
@@ -34,6 +59,77 @@ class SendTestCase(unittest.TestCase):
         s.send("Hello!" * 40)
         self.assertEqual(True, True)  # add assertion here
 
+    def test_dry_run_bursts(self) -> None:
+        s = ggtransfer.Sender(protocol=2, dry_run=True)
+        self.assertEqual(s.send("1234567890" * 42), True)
+        self.assertEqual(s.bursts, 1)
+        frame_airtime = s.airtime / 3
+        s = ggtransfer.Sender(protocol=2, max_tx=frame_airtime * 1.5, cooldown=2, dry_run=True)
+        self.assertEqual(s.send("1234567890" * 42), True)
+        self.assertEqual(s.bursts, 3)
+        self.assertAlmostEqual(s.cooldown_time, 4)
+
+    def test_dry_run_quiet_from_code(self) -> None:
+        err = io.StringIO()
+        s = ggtransfer.Sender(protocol=2, dry_run=True)
+        with contextlib.redirect_stderr(err):
+            self.assertEqual(s.send("1234567890"), True)
+        self.assertEqual(err.getvalue(), "")
+        self.assertGreater(s.total_time, s.airtime)
+
+    def test_dry_run_frame_too_long(self) -> None:
+        s = ggtransfer.Sender(protocol=2, max_tx=0.1, dry_run=True)
+        self.assertRaises(ggtransfer.GgArgumentsError, s.send, "1234567890")
+
+    def test_dry_run_invalid_limits(self) -> None:
+        self.assertRaises(ggtransfer.GgArgumentsError, ggtransfer.Sender, max_tx=float("nan"))
+        self.assertRaises(ggtransfer.GgArgumentsError, ggtransfer.Sender, cooldown=float("inf"))
+        self.assertRaises(ggtransfer.GgArgumentsError, ggtransfer.Sender, cooldown=-1)
+
+    def test_file_transfer_bursts(self) -> None:
+        stream = RecordingStream()
+        with tempfile.TemporaryDirectory() as tmp:
+            # 198 bytes are 264 Base64 chars, i.e. two pieces of 132 chars + 8 chars CRC.
+            path = Path(tmp).joinpath("data.bin")
+            path.write_bytes(bytes(range(198)))
+            # Protocol 2: header 2.09 s, each piece 4.97 s.
+            s = ggtransfer.Sender(inputfile=str(path), protocol=2, file_transfer=True, max_tx=7.5, cooldown=0.5)
+            with mock.patch("ggtransfer._send.sd.RawOutputStream", return_value=stream):
+                self.assertEqual(s.send(), True)
+        self.assertEqual(s.bursts, 2)
+        sequence: List[str] = []
+        silence = 0
+        for data in stream.writes:
+            if data.count(0) == len(data):
+                silence += len(data)
+                self.assertLessEqual(len(data), 4 * 4096)
+                if not sequence or sequence[-1] != "silence":
+                    sequence.append("silence")
+            else:
+                sequence.append("frame")
+        # Lead-in, header and first piece, cooldown, second piece, tail.
+        self.assertEqual(sequence, ["silence", "frame", "frame", "silence", "frame", "silence"])
+        self.assertEqual(silence, 4 * (48000 + 24000 + 48000))
+
+    def test_frame_too_long_checked_before_playing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("data.bin")
+            path.write_bytes(bytes(range(198)))
+            s = ggtransfer.Sender(inputfile=str(path), protocol=2, file_transfer=True, max_tx=3)
+            with mock.patch("ggtransfer._send.sd.RawOutputStream") as stream_class, \
+                    contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(s.send(), False)
+        stream_class.assert_not_called()
+
+    def test_parse_burst_options(self) -> None:
+        args = _get_parser().parse_args(["send", "-p", "2", "--max-tx", "30", "--cooldown", "10", "--dry-run"])
+        self.assertEqual((args.max_tx, args.cooldown, args.dry_run), (30.0, 10.0, True))
+        args = _get_parser().parse_args(["send"])
+        self.assertEqual((args.max_tx, args.cooldown, args.dry_run), (0, 0, False))
+        for value in ("inf", "nan", "1e400", "-1", "abc"):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                _get_parser().parse_args(["send", "--cooldown", value])
+
     @unittest.skip("skipping test_receive...")
     def test_receive(self) -> None:
         r = ggtransfer.Receiver()